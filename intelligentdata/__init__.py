@@ -1,6 +1,11 @@
 """Intelligent Data API SDK for Python."""
 
-from .client import IntelligentDataClient
+from __future__ import annotations
+
+import os
+import threading
+
+from .client import AsyncIntelligentDataClient, IntelligentDataClient
 from .exceptions import ApiError, AuthenticationError, RateLimitError
 from .models import (
     AddressRequest,
@@ -19,6 +24,13 @@ from .models import (
 
 __all__ = [
     "IntelligentDataClient",
+    "AsyncIntelligentDataClient",
+    "validate_address",
+    "validate_tax_id",
+    "validate_bank_account",
+    "lookup_business",
+    "check_sanctions",
+    "check_directors",
     "ApiError",
     "AuthenticationError",
     "RateLimitError",
@@ -37,3 +49,68 @@ __all__ = [
 ]
 
 __version__ = "0.1.0"
+
+# ── Default Client ────────────────────────────────────────────────────────
+
+_default_client: IntelligentDataClient | None = None
+_default_lock = threading.Lock()
+
+
+def _get_default() -> IntelligentDataClient:
+    """Return the process-wide client, creating it from environment variables on first use.
+
+    Reads ``IDATA_API_KEY`` or ``IDATA_CLIENT_ID``/``IDATA_CLIENT_SECRET``, plus
+    optional ``IDATA_TOKEN_URL`` and ``IDATA_BASE_URL``. The environment is only
+    read once; later changes are not picked up. The client itself is safe to
+    share across threads. Raises ``RuntimeError`` if no credentials are set,
+    before any request is made.
+    """
+    global _default_client
+    if _default_client is None:
+        with _default_lock:
+            if _default_client is None:
+                has_api_key = bool(os.environ.get("IDATA_API_KEY"))
+                has_oauth = bool(os.environ.get("IDATA_CLIENT_ID") and os.environ.get("IDATA_CLIENT_SECRET"))
+                if not (has_api_key or has_oauth):
+                    raise RuntimeError("No credentials: set IDATA_API_KEY or IDATA_CLIENT_ID/IDATA_CLIENT_SECRET")
+                kwargs = {}
+                if os.environ.get("IDATA_BASE_URL"):
+                    kwargs["base_url"] = os.environ["IDATA_BASE_URL"]
+                _default_client = IntelligentDataClient(
+                    api_key=os.environ.get("IDATA_API_KEY"),
+                    client_id=os.environ.get("IDATA_CLIENT_ID"),
+                    client_secret=os.environ.get("IDATA_CLIENT_SECRET"),
+                    token_url=os.environ.get("IDATA_TOKEN_URL"),
+                    **kwargs,
+                )
+    return _default_client
+
+
+def validate_address(req: AddressRequest) -> AddressResponse:
+    """Validate and standardize a postal address using the default client."""
+    return _get_default().validate_address(req)
+
+
+def validate_tax_id(req: TaxIdRequest) -> TaxIdResponse:
+    """Validate a tax identification number using the default client."""
+    return _get_default().validate_tax_id(req)
+
+
+def validate_bank_account(req: BankAccountRequest) -> BankAccountResponse:
+    """Verify bank account details using the default client."""
+    return _get_default().validate_bank_account(req)
+
+
+def lookup_business(req: BusinessLookupRequest) -> BusinessLookupResponse:
+    """Look up official business registration data using the default client."""
+    return _get_default().lookup_business(req)
+
+
+def check_sanctions(req: SanctionsRequest) -> SanctionsResponse:
+    """Screen an entity against global sanctions lists using the default client."""
+    return _get_default().check_sanctions(req)
+
+
+def check_directors(req: DirectorsRequest) -> DirectorsResponse:
+    """Check for disqualified directors using the default client."""
+    return _get_default().check_directors(req)
@@ -0,0 +1,37 @@
+"""JSON encoding/decoding, using orjson or msgspec when one is installed.
+
+Whatever the backend, ``loads`` raises ``ValueError`` on input it cannot decode.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+try:
+    from orjson import JSONDecodeError as DecodeError
+    from orjson import dumps, loads
+except ImportError:
+    try:
+        from msgspec import DecodeError as _MsgspecDecodeError
+        from msgspec.json import decode as _msgspec_decode
+        from msgspec.json import encode as dumps
+    except ImportError:
+        import json
+        from json import JSONDecodeError as DecodeError
+
+        loads = json.loads
+
+        def dumps(obj: Any) -> bytes:
+            return json.dumps(obj, separators=(",", ":")).encode()
+
+    else:
+        DecodeError = ValueError
+
+        def loads(data: bytes | str) -> Any:
+            try:
+                return _msgspec_decode(data)
+            except _MsgspecDecodeError as exc:
+                raise ValueError(str(exc)) from exc
+
+
+__all__ = ["DecodeError", "dumps", "loads"]
@@ -2,11 +2,20 @@
 
 from __future__ import annotations
 
+import asyncio
+import threading
 import time
 from dataclasses import dataclass
+from typing import AsyncGenerator, Generator
 
 import httpx
 
+from ._json import loads as _json_loads
+
+# Extra attempts for token fetches that fail to connect, separate from the client's request retries.
+_TOKEN_CONNECT_RETRIES = 2
+_TOKEN_RETRY_BACKOFF = 0.5
+
 
 @dataclass
 class _TokenCache:
@@ -15,7 +24,11 @@ class _TokenCache:
 
 
 class OAuth2TokenManager:
-    """Manages OAuth2 client credentials tokens with automatic refresh."""
+    """Manages OAuth2 client credentials tokens with automatic refresh.
+
+    Safe to share across threads: concurrent callers that find the cache
+    stale wait on a lock so only one of them fetches a new token.
+    """
 
     def __init__(
         self,
@@ -29,25 +42,177 @@ class OAuth2TokenManager:
         self._token_url = token_url
         self._http_client = http_client
         self._cache: _TokenCache | None = None
+        self._lock = threading.Lock()
+
+    def _cached_token(self) -> str | None:
+        cache = self._cache
+        if cache and time.time() < cache.expires_at - 30:
+            return cache.access_token
+        return None
 
     def get_token(self) -> str:
         """Return a valid access token, refreshing if needed."""
-        if self._cache and time.time() < self._cache.expires_at - 30:
+        token = self._cached_token()
+        if token:
+            return token
+
+        with self._lock:
+            token = self._cached_token()
+            if token:
+                return token
+
+            for attempt in range(_TOKEN_CONNECT_RETRIES + 1):
+                try:
+                    resp = self._http_client.post(
+                        self._token_url,
+                        data={
+                            "grant_type": "client_credentials",
+                            "client_id": self._client_id,
+                            "client_secret": self._client_secret,
+                        },
+                        # Bypass the client's own OAuth2 auth flow for the token request itself.
+                        auth=None,
+                    )
+                    break
+                except (httpx.ConnectError, httpx.ConnectTimeout):
+                    # Nothing was sent, so retrying the connect is safe.
+                    if attempt == _TOKEN_CONNECT_RETRIES:
+                        raise
+                    time.sleep(_TOKEN_RETRY_BACKOFF * 2**attempt)
+            resp.raise_for_status()
+            data = _json_loads(resp.content)
+
+            self._cache = _TokenCache(
+                access_token=data["access_token"],
+                expires_at=time.time() + data.get("expires_in", 3600),
+            )
             return self._cache.access_token
 
-        resp = self._http_client.post(
-            self._token_url,
-            data={
-                "grant_type": "client_credentials",
-                "client_id": self._client_id,
-                "client_secret": self._client_secret,
-            },
-        )
-        resp.raise_for_status()
-        data = resp.json()
-
-        self._cache = _TokenCache(
-            access_token=data["access_token"],
-            expires_at=time.time() + data.get("expires_in", 3600),
-        )
-        return self._cache.access_token
+    def invalidate(self, token: str | None = None) -> None:
+        """Drop the cached token so the next call fetches a new one.
+
+        If ``token`` is given, the cache is only cleared while it still holds
+        that token, so a token another thread has already refreshed is kept.
+        """
+        with self._lock:
+            if token is None or (self._cache and self._cache.access_token == token):
+                self._cache = None
+
+
+class AsyncOAuth2TokenManager:
+    """Async counterpart of :class:`OAuth2TokenManager`.
+
+    Concurrent callers share a single refresh: the first coroutine to find the
+    cache stale fetches a new token while the others wait on the lock and then
+    reuse it.
+    """
+
+    def __init__(
+        self,
+        client_id: str,
+        client_secret: str,
+        token_url: str,
+        http_client: httpx.AsyncClient,
+    ):
+        self._client_id = client_id
+        self._client_secret = client_secret
+        self._token_url = token_url
+        self._http_client = http_client
+        self._cache: _TokenCache | None = None
+        # Created on first use so it binds to the running loop (asyncio.Lock on 3.9
+        # attaches to the current loop at construction).
+        self._lock: asyncio.Lock | None = None
+
+    def _cached_token(self) -> str | None:
+        cache = self._cache
+        if cache and time.time() < cache.expires_at - 30:
+            return cache.access_token
+        return None
+
+    async def get_token(self) -> str:
+        """Return a valid access token, refreshing if needed."""
+        token = self._cached_token()
+        if token:
+            return token
+
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            token = self._cached_token()
+            if token:
+                return token
+
+            for attempt in range(_TOKEN_CONNECT_RETRIES + 1):
+                try:
+                    resp = await self._http_client.post(
+                        self._token_url,
+                        data={
+                            "grant_type": "client_credentials",
+                            "client_id": self._client_id,
+                            "client_secret": self._client_secret,
+                        },
+                        # Bypass the client's own OAuth2 auth flow for the token request itself.
+                        auth=None,
+                    )
+                    break
+                except (httpx.ConnectError, httpx.ConnectTimeout):
+                    # Nothing was sent, so retrying the connect is safe.
+                    if attempt == _TOKEN_CONNECT_RETRIES:
+                        raise
+                    await asyncio.sleep(_TOKEN_RETRY_BACKOFF * 2**attempt)
+            resp.raise_for_status()
+            data = _json_loads(resp.content)
+
+            self._cache = _TokenCache(
+                access_token=data["access_token"],
+                expires_at=time.time() + data.get("expires_in", 3600),
+            )
+            return self._cache.access_token
+
+    def invalidate(self, token: str | None = None) -> None:
+        """Drop the cached token so the next call fetches a new one.
+
+        See :meth:`OAuth2TokenManager.invalidate`.
+        """
+        if token is None or (self._cache and self._cache.access_token == token):
+            self._cache = None
+
+
+class OAuth2Auth(httpx.Auth):
+    """httpx auth flow that attaches a bearer token from an :class:`OAuth2TokenManager`.
+
+    A 401 response invalidates the token and the request is replayed once
+    with a freshly fetched one.
+    """
+
+    requires_response_body = False
+
+    def __init__(self, manager: OAuth2TokenManager):
+        self._manager = manager
+
+    def auth_flow(self, request: httpx.Request) -> Generator[httpx.Request, httpx.Response, None]:
+        token = self._manager.get_token()
+        request.headers["Authorization"] = f"Bearer {token}"
+        response = yield request
+        if response.status_code == 401:
+            self._manager.invalidate(token)
+            request.headers["Authorization"] = f"Bearer {self._manager.get_token()}"
+            yield request
+
+
+class AsyncOAuth2Auth(httpx.Auth):
+    """httpx auth flow that attaches a bearer token from an :class:`AsyncOAuth2TokenManager`."""
+
+    requires_response_body = False
+
+    def __init__(self, manager: AsyncOAuth2TokenManager):
+        self._manager = manager
+
+    async def async_auth_flow(self, request: httpx.Request) -> AsyncGenerator[httpx.Request, httpx.Response]:
+        token = await self._manager.get_token()
+        request.headers["Authorization"] = f"Bearer {token}"
+        response = yield request
+        if response.status_code == 401:
+            self._manager.invalidate(token)
+            request.headers["Authorization"] = f"Bearer {await self._manager.get_token()}"
+            yield request
@@ -2,13 +2,19 @@
 
 from __future__ import annotations
 
+import asyncio
+import logging
+import random
 import time
-from dataclasses import asdict
-from typing import Any, TypeVar
+from email.utils import parsedate_to_datetime
+from typing import Any, Awaitable, Callable, Sequence, TypeVar
 
 import httpx
 
-from .auth import OAuth2TokenManager
+from ._json import DecodeError as _JSONDecodeError
+from ._json import dumps as _json_dumps
+from ._json import loads as _json_loads
+from .auth import AsyncOAuth2Auth, AsyncOAuth2TokenManager, OAuth2Auth, OAuth2TokenManager
 from .exceptions import ApiError, AuthenticationError, RateLimitError
 from .models import (
     AddressRequest,
@@ -30,16 +36,78 @@ T = TypeVar("T")
 _VERSION = "0.1.0"
 _DEFAULT_BASE_URL = "https://api.smartvmapi.com"
 _MAX_RETRIES = 3
-
-
-def _to_camel(name: str) -> str:
-    parts = name.split("_")
-    return parts[0] + "".join(w.capitalize() for w in parts[1:])
-
-
-def _serialize(obj: Any) -> dict[str, Any]:
-    raw = asdict(obj)
-    return {_to_camel(k): v for k, v in raw.items() if v != "" and v != 0}
+_MAX_RETRY_AFTER = 60.0
+_DEFAULT_CONCURRENCY = 10
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+logger = logging.getLogger(__name__)
+
+_ROUTES: dict[type, tuple[str, type]] = {
+    AddressRequest: ("/api/validate/address", AddressResponse),
+    TaxIdRequest: ("/api/validate/taxid", TaxIdResponse),
+    BankAccountRequest: ("/api/validate/bank", BankAccountResponse),
+    BusinessLookupRequest: ("/api/enrich/business", BusinessLookupResponse),
+    SanctionsRequest: ("/api/risk/sanctions", SanctionsResponse),
+    DirectorsRequest: ("/api/risk/directors", DirectorsResponse),
+}
+
+
+def _route(req: Any) -> tuple[str, Any]:
+    try:
+        return _ROUTES[type(req)]
+    except KeyError:
+        raise TypeError(f"Unsupported request type: {type(req).__name__}") from None
+
+
+def _is_token_fetch(exc: httpx.TransportError, token_url: str | None) -> bool:
+    """Whether a transport error came from the OAuth2 token request rather than the API call."""
+    if token_url is None:
+        return False
+    try:
+        return exc.request.url == token_url
+    except RuntimeError:
+        return False
+
+
+def _backoff(attempt: int, base: float = 0.5, cap: float = 30.0) -> float:
+    """Full-jitter exponential backoff delay for the given attempt."""
+    return min(cap, random.uniform(0, base * 2**attempt))
+
+
+def _parse_retry_after(value: str | None) -> float | None:
+    """Parse a ``Retry-After`` header given as delta-seconds or an HTTP-date."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, when.timestamp() - time.time())
+
+
+def _error_body(resp: httpx.Response) -> dict[str, Any]:
+    """Decode an error response body once; empty or non-JSON bodies yield ``{}``."""
+    if not resp.content:
+        return {}
+    try:
+        data = _json_loads(resp.content)
+    except (ValueError, _JSONDecodeError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _rate_limit_delay(retry_after: float | None, attempt: int, max_retry_after: float) -> float:
+    """Delay before retrying a 429, honoring ``Retry-After`` up to ``max_retry_after``."""
+    if retry_after is None:
+        return _backoff(attempt)
+    if retry_after > max_retry_after:
+        logger.warning("Retry-After of %.1fs exceeds max_retry_after; waiting %.1fs", retry_after, max_retry_after)
+        retry_after = max_retry_after
+    return retry_after + random.uniform(0, 0.5)
 
 
 class IntelligentDataClient:
@@ -64,21 +132,31 @@ class IntelligentDataClient:
         token_url: str | None = None,
         base_url: str = _DEFAULT_BASE_URL,
         timeout: float = 30.0,
+        max_retry_after: float = _MAX_RETRY_AFTER,
     ):
         self._api_key = api_key
+        self._max_retry_after = max_retry_after
         self._base_url = base_url.rstrip("/")
+        headers = {"User-Agent": f"intelligentdata-python-sdk/{_VERSION}"}
+        if api_key:
+            headers["X-Api-Key"] = api_key
         self._http = httpx.Client(
+            http2=True,
             timeout=timeout,
-            headers={"User-Agent": f"intelligentdata-python-sdk/{_VERSION}"},
+            headers=headers,
+            limits=httpx.Limits(max_keepalive_connections=32, max_connections=64, keepalive_expiry=60.0),
         )
         self._oauth: OAuth2TokenManager | None = None
-        if client_id and client_secret:
+        self._token_url: str | None = None
+        if client_id and client_secret and not api_key:
+            self._token_url = token_url or f"{self._base_url}/api/oauth/token"
             self._oauth = OAuth2TokenManager(
                 client_id=client_id,
                 client_secret=client_secret,
-                token_url=token_url or f"{self._base_url}/api/oauth/token",
+                token_url=self._token_url,
                 http_client=self._http,
             )
+            self._http.auth = OAuth2Auth(self._oauth)
 
     def __enter__(self) -> IntelligentDataClient:
         return self
@@ -90,117 +168,283 @@ class IntelligentDataClient:
         """Close the underlying HTTP client."""
         self._http.close()
 
-    def _headers(self) -> dict[str, str]:
-        headers: dict[str, str] = {}
-        if self._api_key:
-            headers["X-Api-Key"] = self._api_key
-        elif self._oauth:
-            headers["Authorization"] = f"Bearer {self._oauth.get_token()}"
-        return headers
-
     def _request(self, method: str, path: str, body: dict[str, Any] | None = None) -> dict[str, Any]:
         url = f"{self._base_url}{path}"
+        content = _json_dumps(body) if body is not None else None
+        headers = _JSON_HEADERS if content is not None else None
+        # The body is already bytes, so one built request can be resent on every attempt.
+        request = self._http.build_request(method, url, content=content, headers=headers)
         last_err: Exception | None = None
 
         for attempt in range(_MAX_RETRIES):
             try:
-                resp = self._http.request(
-                    method,
-                    url,
-                    json=body,
-                    headers=self._headers(),
-                )
+                resp = self._http.send(request)
             except httpx.TransportError as exc:
+                if _is_token_fetch(exc, self._token_url):
+                    # The token manager has already retried its own connect failures.
+                    raise
                 last_err = exc
-                time.sleep(2**attempt)
+                if attempt < _MAX_RETRIES - 1:
+                    time.sleep(_backoff(attempt))
                 continue
 
             if resp.status_code == 429:
-                retry_after = float(resp.headers.get("Retry-After", 2**attempt))
+                retry_after = _parse_retry_after(resp.headers.get("Retry-After"))
                 if attempt < _MAX_RETRIES - 1:
-                    time.sleep(retry_after)
+                    time.sleep(_rate_limit_delay(retry_after, attempt, self._max_retry_after))
                     continue
-                raise RateLimitError(retry_after=retry_after, raw=resp.json() if resp.content else None)
+                raise RateLimitError(retry_after=retry_after, raw=_error_body(resp))
 
             if resp.status_code >= 500:
                 last_err = ApiError(resp.status_code, resp.text)
                 if attempt < _MAX_RETRIES - 1:
-                    time.sleep(2**attempt)
+                    time.sleep(_backoff(attempt))
                     continue
                 raise last_err
 
             if resp.status_code in (401, 403):
-                data = resp.json() if resp.content else {}
+                data = _error_body(resp)
                 raise AuthenticationError(data.get("message", "Authentication failed"), raw=data)
 
             if resp.status_code >= 400:
-                data = resp.json() if resp.content else {}
+                data = _error_body(resp)
                 raise ApiError(resp.status_code, data.get("message", "Request failed"), raw=data)
 
-            return resp.json()
+            return _json_loads(resp.content)
 
         raise last_err or ApiError(0, "Request failed after retries")
 
     # ── Public Methods ────────────────────────────────────────────────────
 
+    def call(self, req: Any) -> Any:
+        """Send any request model to its endpoint and return the matching response model."""
+        path, resp_cls = _route(req)
+        return resp_cls._from_dict(self._request("POST", path, req.to_payload()))
+
     def validate_address(self, req: AddressRequest) -> AddressResponse:
         """Validate and standardize a postal address."""
-        data = self._request("POST", "/api/validate/address", _serialize(req))
-        return AddressResponse(
-            is_valid=data.get("isValid", False),
-            confidence_score=data.get("confidenceScore", 0.0),
-            standardized_address=data.get("standardizedAddress", {}),
-            raw=data,
-        )
+        return self.call(req)
 
     def validate_tax_id(self, req: TaxIdRequest) -> TaxIdResponse:
         """Validate a tax identification number."""
-        data = self._request("POST", "/api/validate/taxid", _serialize(req))
-        return TaxIdResponse(
-            is_valid=data.get("isValid", False),
-            tax_id_type=data.get("taxIdType", ""),
-            country=data.get("country", ""),
-            registered_name=data.get("registeredName", ""),
-            raw=data,
-        )
+        return self.call(req)
 
     def validate_bank_account(self, req: BankAccountRequest) -> BankAccountResponse:
         """Verify bank account details."""
-        data = self._request("POST", "/api/validate/bank", _serialize(req))
-        return BankAccountResponse(
-            is_valid=data.get("isValid", False),
-            bank_name=data.get("bankName", ""),
-            account_type=data.get("accountType", ""),
-            raw=data,
-        )
+        return self.call(req)
 
     def lookup_business(self, req: BusinessLookupRequest) -> BusinessLookupResponse:
         """Look up official business registration data."""
-        data = self._request("POST", "/api/enrich/business", _serialize(req))
-        return BusinessLookupResponse(
-            found=data.get("found", False),
-            company_name=data.get("companyName", ""),
-            registration_number=data.get("registrationNumber", ""),
-            status=data.get("status", ""),
-            address=data.get("address", {}),
-            raw=data,
-        )
+        return self.call(req)
 
     def check_sanctions(self, req: SanctionsRequest) -> SanctionsResponse:
         """Screen an entity against global sanctions lists."""
-        data = self._request("POST", "/api/risk/sanctions", _serialize(req))
-        return SanctionsResponse(
-            has_matches=data.get("hasMatches", False),
-            matches=data.get("matches", []),
-            screened_lists=data.get("screenedLists", []),
-            raw=data,
-        )
+        return self.call(req)
 
     def check_directors(self, req: DirectorsRequest) -> DirectorsResponse:
         """Check for disqualified directors."""
-        data = self._request("POST", "/api/risk/directors", _serialize(req))
-        return DirectorsResponse(
-            has_disqualified=data.get("hasDisqualified", False),
-            directors=data.get("directors", []),
-            raw=data,
+        return self.call(req)
+
+
+class AsyncIntelligentDataClient:
+    """Async client for the Intelligent Data API.
+
+    Mirrors :class:`IntelligentDataClient` on top of ``httpx.AsyncClient`` so
+    many calls can be in flight at once.
+
+    Usage::
+
+        async with AsyncIntelligentDataClient(api_key="svm...") as client:
+            results = await asyncio.gather(
+                *(client.validate_address(req) for req in requests)
+            )
+
+    Each ``*_batch`` method runs a list of requests concurrently, keeping at
+    most ``concurrency`` in flight, and returns results in input order. On the
+    first failure the remaining requests are cancelled and the error is raised.
+    """
+
+    def __init__(
+        self,
+        api_key: str | None = None,
+        client_id: str | None = None,
+        client_secret: str | None = None,
+        token_url: str | None = None,
+        base_url: str = _DEFAULT_BASE_URL,
+        timeout: float = 30.0,
+        max_retry_after: float = _MAX_RETRY_AFTER,
+    ):
+        self._api_key = api_key
+        self._max_retry_after = max_retry_after
+        self._base_url = base_url.rstrip("/")
+        headers = {"User-Agent": f"intelligentdata-python-sdk/{_VERSION}"}
+        if api_key:
+            headers["X-Api-Key"] = api_key
+        self._http = httpx.AsyncClient(
+            http2=True,
+            timeout=timeout,
+            headers=headers,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=30),
         )
+        self._oauth: AsyncOAuth2TokenManager | None = None
+        self._token_url: str | None = None
+        if client_id and client_secret and not api_key:
+            self._token_url = token_url or f"{self._base_url}/api/oauth/token"
+            self._oauth = AsyncOAuth2TokenManager(
+                client_id=client_id,
+                client_secret=client_secret,
+                token_url=self._token_url,
+                http_client=self._http,
+            )
+            self._http.auth = AsyncOAuth2Auth(self._oauth)
+
+    async def __aenter__(self) -> AsyncIntelligentDataClient:
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Close the underlying HTTP client."""
+        await self._http.aclose()
+
+    async def _request(self, method: str, path: str, body: dict[str, Any] | None = None) -> dict[str, Any]:
+        url = f"{self._base_url}{path}"
+        content = _json_dumps(body) if body is not None else None
+        headers = _JSON_HEADERS if content is not None else None
+        # The body is already bytes, so one built request can be resent on every attempt.
+        request = self._http.build_request(method, url, content=content, headers=headers)
+        last_err: Exception | None = None
+
+        for attempt in range(_MAX_RETRIES):
+            try:
+                resp = await self._http.send(request)
+            except httpx.TransportError as exc:
+                if _is_token_fetch(exc, self._token_url):
+                    # The token manager has already retried its own connect failures.
+                    raise
+                last_err = exc
+                if attempt < _MAX_RETRIES - 1:
+                    await asyncio.sleep(_backoff(attempt))
+                continue
+
+            if resp.status_code == 429:
+                retry_after = _parse_retry_after(resp.headers.get("Retry-After"))
+                if attempt < _MAX_RETRIES - 1:
+                    await asyncio.sleep(_rate_limit_delay(retry_after, attempt, self._max_retry_after))
+                    continue
+                raise RateLimitError(retry_after=retry_after, raw=_error_body(resp))
+
+            if resp.status_code >= 500:
+                last_err = ApiError(resp.status_code, resp.text)
+                if attempt < _MAX_RETRIES - 1:
+                    await asyncio.sleep(_backoff(attempt))
+                    continue
+                raise last_err
+
+            if resp.status_code in (401, 403):
+                data = _error_body(resp)
+                raise AuthenticationError(data.get("message", "Authentication failed"), raw=data)
+
+            if resp.status_code >= 400:
+                data = _error_body(resp)
+                raise ApiError(resp.status_code, data.get("message", "Request failed"), raw=data)
+
+            return _json_loads(resp.content)
+
+        raise last_err or ApiError(0, "Request failed after retries")
+
+    # ── Public Methods ────────────────────────────────────────────────────
+
+    async def call(self, req: Any) -> Any:
+        """Send any request model to its endpoint and return the matching response model."""
+        path, resp_cls = _route(req)
+        return resp_cls._from_dict(await self._request("POST", path, req.to_payload()))
+
+    async def validate_address(self, req: AddressRequest) -> AddressResponse:
+        """Validate and standardize a postal address."""
+        return await self.call(req)
+
+    async def validate_tax_id(self, req: TaxIdRequest) -> TaxIdResponse:
+        """Validate a tax identification number."""
+        return await self.call(req)
+
+    async def validate_bank_account(self, req: BankAccountRequest) -> BankAccountResponse:
+        """Verify bank account details."""
+        return await self.call(req)
+
+    async def lookup_business(self, req: BusinessLookupRequest) -> BusinessLookupResponse:
+        """Look up official business registration data."""
+        return await self.call(req)
+
+    async def check_sanctions(self, req: SanctionsRequest) -> SanctionsResponse:
+        """Screen an entity against global sanctions lists."""
+        return await self.call(req)
+
+    async def check_directors(self, req: DirectorsRequest) -> DirectorsResponse:
+        """Check for disqualified directors."""
+        return await self.call(req)
+
+    # ── Batch Methods ─────────────────────────────────────────────────────
+
+    async def _gather(
+        self, fn: Callable[[Any], Awaitable[T]], reqs: Sequence[Any], concurrency: int
+    ) -> list[T]:
+        if concurrency < 1:
+            raise ValueError(f"concurrency must be at least 1, got {concurrency}")
+        sem = asyncio.Semaphore(concurrency)
+
+        async def one(req: Any) -> T:
+            async with sem:
+                return await fn(req)
+
+        tasks = [asyncio.ensure_future(one(r)) for r in reqs]
+        if not tasks:
+            return []
+        try:
+            await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        for task in tasks:
+            if not task.cancelled() and task.exception() is not None:
+                raise task.exception()  # type: ignore[misc]
+        return [task.result() for task in tasks]
+
+    async def validate_addresses_batch(
+        self, reqs: Sequence[AddressRequest], concurrency: int = _DEFAULT_CONCURRENCY
+    ) -> list[AddressResponse]:
+        """Validate many postal addresses concurrently."""
+        return await self._gather(self.validate_address, reqs, concurrency)
+
+    async def validate_tax_ids_batch(
+        self, reqs: Sequence[TaxIdRequest], concurrency: int = _DEFAULT_CONCURRENCY
+    ) -> list[TaxIdResponse]:
+        """Validate many tax identification numbers concurrently."""
+        return await self._gather(self.validate_tax_id, reqs, concurrency)
+
+    async def validate_bank_accounts_batch(
+        self, reqs: Sequence[BankAccountRequest], concurrency: int = _DEFAULT_CONCURRENCY
+    ) -> list[BankAccountResponse]:
+        """Verify many bank accounts concurrently."""
+        return await self._gather(self.validate_bank_account, reqs, concurrency)
+
+    async def lookup_businesses_batch(
+        self, reqs: Sequence[BusinessLookupRequest], concurrency: int = _DEFAULT_CONCURRENCY
+    ) -> list[BusinessLookupResponse]:
+        """Look up many business registrations concurrently."""
+        return await self._gather(self.lookup_business, reqs, concurrency)
+
+    async def check_sanctions_batch(
+        self, reqs: Sequence[SanctionsRequest], concurrency: int = _DEFAULT_CONCURRENCY
+    ) -> list[SanctionsResponse]:
+        """Screen many entities against sanctions lists concurrently."""
+        return await self._gather(self.check_sanctions, reqs, concurrency)
+
+    async def check_directors_batch(
+        self, reqs: Sequence[DirectorsRequest], concurrency: int = _DEFAULT_CONCURRENCY
+    ) -> list[DirectorsResponse]:
+        """Check many companies for disqualified directors concurrently."""
+        return await self._gather(self.check_directors, reqs, concurrency)
@@ -2,25 +2,71 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from typing import Any
+import sys
+from dataclasses import dataclass, field, fields
+from functools import lru_cache
+from typing import Any, ClassVar, TypeVar
+
+T = TypeVar("T")
+
+# slots=True needs Python 3.10+; on 3.9 the models keep a per-instance __dict__.
+_DATACLASS_OPTS: dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@lru_cache(maxsize=128)
+def _to_camel(name: str) -> str:
+    parts = name.split("_")
+    return parts[0] + "".join(w.capitalize() for w in parts[1:])
+
+
+def _camel_fields(cls: type[T]) -> type[T]:
+    """Precompute the ``(field_name, camelName)`` pairs of a dataclass, excluding ``raw``."""
+    cls._CAMEL_FIELDS = tuple((f.name, _to_camel(f.name)) for f in fields(cls) if f.name != "raw")
+    return cls
+
+
+class _Request:
+    """Base for request models."""
+
+    __slots__ = ()
+
+    _CAMEL_FIELDS: ClassVar[tuple[tuple[str, str], ...]] = ()
+
+    def to_payload(self) -> dict[str, Any]:
+        """Return the camelCase JSON body for this request, omitting ``None`` fields."""
+        return {camel: v for name, camel in self._CAMEL_FIELDS if (v := getattr(self, name)) is not None}
+
+
+class _Response:
+    """Base for response models."""
+
+    __slots__ = ()
+
+    _CAMEL_FIELDS: ClassVar[tuple[tuple[str, str], ...]] = ()
+
+    @classmethod
+    def _from_dict(cls: type[T], data: dict[str, Any]) -> T:
+        """Build a response from the API's camelCase JSON, keeping it as ``raw``."""
+        return cls(**{name: data[camel] for name, camel in cls._CAMEL_FIELDS if camel in data}, raw=data)
 
 
 # ── Address Validation ────────────────────────────────────────────────────
 
 
-@dataclass
-class AddressRequest:
+@_camel_fields
+@dataclass(**_DATACLASS_OPTS)
+class AddressRequest(_Request):
     address_line1: str
     city: str
     country: str
-    address_line2: str = ""
-    state: str = ""
-    postal_code: str = ""
+    address_line2: str | None = None
+    state: str | None = None
+    postal_code: str | None = None
 
 
-@dataclass
-class AddressResponse:
+@_camel_fields
+@dataclass(**_DATACLASS_OPTS)
+class AddressResponse(_Response):
     is_valid: bool = False
     confidence_score: float = 0.0
     standardized_address: dict[str, str] = field(default_factory=dict)
@@ -30,15 +76,17 @@ class AddressResponse:
 # ── Tax ID Validation ─────────────────────────────────────────────────────
 
 
-@dataclass
-class TaxIdRequest:
+@_camel_fields
+@dataclass(**_DATACLASS_OPTS)
+class TaxIdRequest(_Request):
     tax_id: str
     country: str
-    tax_id_type: str = ""
+    tax_id_type: str | None = None
 
 
-@dataclass
-class TaxIdResponse:
+@_camel_fields
+@dataclass(**_DATACLASS_OPTS)
+class TaxIdResponse(_Response):
     is_valid: bool = False
     tax_id_type: str = ""
     country: str = ""
@@ -49,17 +97,19 @@ class TaxIdResponse:
 # ── Bank Account Validation ───────────────────────────────────────────────
 
 
-@dataclass
-class BankAccountRequest:
+@_camel_fields
+@dataclass(**_DATACLASS_OPTS)
+class BankAccountRequest(_Request):
     account_number: str
     country: str
-    routing_number: str = ""
-    iban: str = ""
-    bank_code: str = ""
+    routing_number: str | None = None
+    iban: str | None = None
+    bank_code: str | None = None
 
 
-@dataclass
-class BankAccountResponse:
+@_camel_fields
+@dataclass(**_DATACLASS_OPTS)
+class BankAccountResponse(_Response):
     is_valid: bool = False
     bank_name: str = ""
     account_type: str = ""
@@ -69,16 +119,18 @@ class BankAccountResponse:
 # ── Business Lookup ───────────────────────────────────────────────────────
 
 
-@dataclass
-class BusinessLookupRequest:
+@_camel_fields
+@dataclass(**_DATACLASS_OPTS)
+class BusinessLookupRequest(_Request):
     company_name: str
     country: str
-    registration_number: str = ""
-    state: str = ""
+    registration_number: str | None = None
+    state: str | None = None
 
 
-@dataclass
-class BusinessLookupResponse:
+@_camel_fields
+@dataclass(**_DATACLASS_OPTS)
+class BusinessLookupResponse(_Response):
     found: bool = False
     company_name: str = ""
     registration_number: str = ""
@@ -90,15 +142,17 @@ class BusinessLookupResponse:
 # ── Sanctions Screening ──────────────────────────────────────────────────
 
 
-@dataclass
-class SanctionsRequest:
+@_camel_fields
+@dataclass(**_DATACLASS_OPTS)
+class SanctionsRequest(_Request):
     entity_name: str
     entity_type: str = "organization"
-    country: str = ""
+    country: str | None = None
 
 
-@dataclass
-class SanctionsResponse:
+@_camel_fields
+@dataclass(**_DATACLASS_OPTS)
+class SanctionsResponse(_Response):
     has_matches: bool = False
     matches: list[dict[str, Any]] = field(default_factory=list)
     screened_lists: list[str] = field(default_factory=list)
@@ -108,15 +162,17 @@ class SanctionsResponse:
 # ── Directors Check ───────────────────────────────────────────────────────
 
 
-@dataclass
-class DirectorsRequest:
+@_camel_fields
+@dataclass(**_DATACLASS_OPTS)
+class DirectorsRequest(_Request):
     company_name: str
     country: str
-    registration_number: str = ""
+    registration_number: str | None = None
 
 
-@dataclass
-class DirectorsResponse:
+@_camel_fields
+@dataclass(**_DATACLASS_OPTS)
+class DirectorsResponse(_Response):
     has_disqualified: bool = False
     directors: list[dict[str, Any]] = field(default_factory=list)
     raw: dict[str, Any] = field(default_factory=dict)